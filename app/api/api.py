@@ -1,6 +1,8 @@
 from fastapi import APIRouter
 
-from app.api.endpoints import products
+from app.api.endpoints import product_changes, product_imports, products
 
 main_router = APIRouter()
+main_router.include_router(product_changes.router, tags=["products"])
+main_router.include_router(product_imports.router, tags=["products"])
 main_router.include_router(products.router, tags=["products"])
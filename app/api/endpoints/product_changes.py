@@ -0,0 +1,145 @@
+import asyncio
+from typing import AsyncIterator, Optional
+
+from fastapi import APIRouter, Depends, Header, HTTPException, Query, Request, status
+from fastapi.responses import StreamingResponse
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from app.core.config import (
+    CHANGE_FEED_BATCH_SIZE,
+    CHANGE_FEED_KEEPALIVE_SECONDS,
+    CHANGE_FEED_MAX_STREAM_SECONDS,
+    CHANGE_FEED_POLL_INTERVAL_SECONDS,
+)
+from app.db.session import get_db, get_session_factory
+from app.schemas.product_change import ProductChangeResponse, ProductChangesResponse
+from app.services.product_change import ProductChangeService
+
+router = APIRouter(prefix="/products")
+
+
+async def read_changes(service: ProductChangeService, after: Optional[int]) -> ProductChangesResponse:
+    """
+    Read the next batch of changes after the given sequence number.
+
+    Without a position the client is subscribed at the head of the log. A
+    position that was already purged, or one from a recreated log, results
+    in a reset telling the client to refetch the catalog.
+    """
+    oldest, newest = await service.get_log_bounds()
+    newest = newest or 0
+
+    if after is None:
+        return ProductChangesResponse(changes=[], last_event_id=newest)
+
+    if after > newest or (oldest is not None and after < oldest - 1):
+        return ProductChangesResponse(changes=[], last_event_id=newest, reset=True)
+
+    changes = await service.get_changes_since(after, CHANGE_FEED_BATCH_SIZE)
+
+    return ProductChangesResponse(
+        changes=[ProductChangeResponse.model_validate(change) for change in changes],
+        last_event_id=changes[-1].seq if changes else after,
+    )
+
+
+async def stream_changes(
+        request: Request,
+        session_factory: async_sessionmaker,
+        after: Optional[int],
+) -> AsyncIterator[str]:
+    """
+    Generate Server-Sent Events for product changes.
+
+    The stream outlives the request dependencies, so it uses its own session
+    and releases the connection between polls. It stops when the client
+    disconnects or after CHANGE_FEED_MAX_STREAM_SECONDS, so open feeds never
+    block a graceful shutdown; clients reconnect with Last-Event-ID.
+    """
+    loop = asyncio.get_running_loop()
+    last_sent = loop.time()
+    deadline = last_sent + CHANGE_FEED_MAX_STREAM_SECONDS
+
+    yield f"retry: {int(CHANGE_FEED_POLL_INTERVAL_SECONDS * 1000)}\n\n"
+
+    async with session_factory() as session:
+        service = ProductChangeService(session)
+
+        while loop.time() < deadline and not await request.is_disconnected():
+            batch = await read_changes(service, after)
+            await session.commit()
+
+            if after is None:
+                yield f"id: {batch.last_event_id}\n\n"
+                last_sent = loop.time()
+            elif batch.reset:
+                yield (
+                    f"id: {batch.last_event_id}\nevent: reset\n"
+                    f"data: {batch.model_dump_json(include={'last_event_id'})}\n\n"
+                )
+                last_sent = loop.time()
+
+            for change in batch.changes:
+                yield f"id: {change.seq}\nevent: {change.operation.value}\ndata: {change.model_dump_json()}\n\n"
+                last_sent = loop.time()
+
+            after = batch.last_event_id
+
+            if len(batch.changes) == CHANGE_FEED_BATCH_SIZE:
+                continue
+
+            if loop.time() - last_sent >= CHANGE_FEED_KEEPALIVE_SECONDS:
+                yield ": keepalive\n\n"
+                last_sent = loop.time()
+
+            await asyncio.sleep(min(CHANGE_FEED_POLL_INTERVAL_SECONDS, max(deadline - loop.time(), 0)))
+
+
+@router.get(
+    "/changes",
+    response_model=ProductChangesResponse,
+    summary="Get product changes",
+    description=(
+        "Stream product create/update/delete events. Requests accepting `text/event-stream` get a "
+        "Server-Sent Events stream, other requests get a long-poll batch. Resume with `Last-Event-ID`."
+    ),
+)
+async def get_product_changes(
+        request: Request,
+        last_event_id: Optional[int] = Query(None, ge=0, description="Sequence number to resume after"),
+        last_event_id_header: Optional[int] = Header(None, alias="Last-Event-ID", ge=0),
+        wait: float = Query(0, ge=0, le=60, description="Long-poll: seconds to wait for new changes"),
+        db: AsyncSession = Depends(get_db),
+        session_factory: async_sessionmaker = Depends(get_session_factory)
+):
+    """
+    Retrieve product changes as an SSE stream or a long-poll batch.
+    """
+    after = last_event_id_header if last_event_id_header is not None else last_event_id
+
+    if "text/event-stream" in request.headers.get("accept", ""):
+        return StreamingResponse(
+            stream_changes(request, session_factory, after),
+            media_type="text/event-stream",
+            headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+        )
+
+    service = ProductChangeService(db)
+    loop = asyncio.get_running_loop()
+    deadline = loop.time() + wait
+
+    try:
+        while True:
+            batch = await read_changes(service, after)
+
+            if batch.changes or batch.reset or loop.time() >= deadline:
+                return batch
+
+            after = batch.last_event_id
+            await db.commit()
+            await asyncio.sleep(min(CHANGE_FEED_POLL_INTERVAL_SECONDS, max(deadline - loop.time(), 0)))
+    except Exception as e:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"Error getting product changes: {str(e)}"
+        )
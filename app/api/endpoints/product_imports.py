@@ -0,0 +1,94 @@
+from typing import Optional
+
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, status
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.db.session import get_db
+from app.schemas.product_import import ImportFormat, ProductImportJobResponse
+from app.services.product_import import ProductImportService, spool_upload
+
+router = APIRouter(prefix="/products/imports")
+
+CONTENT_TYPE_FORMATS = {
+    "text/csv": ImportFormat.CSV,
+    "application/x-ndjson": ImportFormat.NDJSON,
+    "application/ndjson": ImportFormat.NDJSON,
+    "application/jsonl": ImportFormat.NDJSON,
+}
+
+
+@router.post(
+    "",
+    response_model=ProductImportJobResponse,
+    status_code=status.HTTP_202_ACCEPTED,
+    summary="Import products from file",
+    description=(
+        "Upload a CSV or NDJSON catalog file as the request body. The file is imported in the background, "
+        "use the returned job ID to track progress"
+    ),
+    responses={415: {"description": "Unsupported file format"}},
+)
+async def create_product_import(
+        request: Request,
+        import_format: Optional[ImportFormat] = Query(
+            None, alias="format", description="File format, detected from Content-Type if omitted"
+        ),
+        db: AsyncSession = Depends(get_db)
+) -> ProductImportJobResponse:
+    """
+    Spool an uploaded catalog file and create an import job.
+    """
+    content_type = request.headers.get("content-type", "").split(";")[0].strip().lower()
+    import_format = import_format or CONTENT_TYPE_FORMATS.get(content_type)
+
+    if import_format is None:
+        raise HTTPException(
+            status_code=status.HTTP_415_UNSUPPORTED_MEDIA_TYPE,
+            detail="File format must be csv or ndjson"
+        )
+
+    service = ProductImportService(db)
+
+    try:
+        file_path, bytes_total = await spool_upload(request.stream())
+        return await service.create_job(import_format, file_path, bytes_total)
+    except Exception as e:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"Error creating import: {str(e)}"
+        )
+
+
+@router.get(
+    "/{job_id}",
+    response_model=ProductImportJobResponse,
+    summary="Get import job",
+    description="Retrieve status, progress, throughput and row-level errors of a catalog import",
+    responses={404: {"description": "Import job not found"}},
+)
+async def get_product_import(
+        job_id: int,
+        db: AsyncSession = Depends(get_db)
+) -> ProductImportJobResponse:
+    """
+    Retrieve an import job by ID.
+    """
+    service = ProductImportService(db)
+
+    try:
+        job = await service.get_job_by_id(job_id)
+
+        if not job:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail=f"Import job with id {job_id} not found"
+            )
+
+        return job
+    except HTTPException as e:
+        raise e
+    except Exception as e:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"Error getting import job: {str(e)}"
+        )
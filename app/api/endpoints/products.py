@@ -1,10 +1,11 @@
-from fastapi import APIRouter, Depends, HTTPException, status, Query
+from fastapi import APIRouter, Depends, HTTPException, Response, status, Query
 from sqlalchemy.ext.asyncio import AsyncSession
 from typing import Optional, List
 
 from app.db.session import get_db
-from app.schemas.product import ProductCreate, ProductResponse, ProductListResponse
+from app.schemas.product import CountPrecision, ProductCreate, ProductResponse, ProductListResponse
 from app.services.product import ProductService
+from app.services.product_batcher import ProductWriteBatcher, get_product_write_batcher
 
 router = APIRouter(prefix="/products")
 
@@ -16,7 +17,11 @@ router = APIRouter(prefix="/products")
     description="Retrieve a paginated list of products with optional category filtering",
 )
 async def get_products_list(
+        response: Response,
         category: Optional[str] = Query(None, description="Filter products by category"),
+        count: Optional[CountPrecision] = Query(
+            None, description="Return the total number of products in the X-Total-Count header"
+        ),
         db: AsyncSession = Depends(get_db)
 ) -> List[ProductListResponse]:
     """
@@ -30,6 +35,11 @@ async def get_products_list(
         else:
             products = await service.get_all_products()
 
+        if count:
+            total = await service.count_products(category or None, count)
+            response.headers["X-Total-Count"] = str(total)
+            response.headers["X-Total-Count-Precision"] = count.value
+
         return [ProductListResponse.model_validate(product) for product in products]
     except Exception as e:
         raise HTTPException(
@@ -82,7 +92,8 @@ async def get_product(
 )
 async def create_product(
         product_data: ProductCreate,
-        db: AsyncSession = Depends(get_db)
+        db: AsyncSession = Depends(get_db),
+        batcher: Optional[ProductWriteBatcher] = Depends(get_product_write_batcher)
 ) -> ProductResponse:
     """
     Create a new product.
@@ -90,6 +101,9 @@ async def create_product(
     service = ProductService(db)
 
     try:
+        if batcher:
+            return await batcher.create_product(product_data)
+
         return await service.create_product(product_data)
     except Exception as e:
         raise HTTPException(
@@ -1,4 +1,5 @@
 import os
+import tempfile
 from pathlib import Path
 
 from dotenv import load_dotenv
@@ -7,4 +8,24 @@ PROJECT_ROOT = Path(__file__).parent.parent.parent
 
 load_dotenv()
 
-DATABASE_URL = os.getenv("DATABASE_URL")
\ No newline at end of file
+DATABASE_URL = os.getenv("DATABASE_URL")
+
+# Product change feed
+CHANGE_LOG_RETENTION_SECONDS = int(os.getenv("CHANGE_LOG_RETENTION_SECONDS", 24 * 60 * 60))
+CHANGE_LOG_PURGE_INTERVAL_SECONDS = float(os.getenv("CHANGE_LOG_PURGE_INTERVAL_SECONDS", 10 * 60))
+CHANGE_FEED_POLL_INTERVAL_SECONDS = float(os.getenv("CHANGE_FEED_POLL_INTERVAL_SECONDS", 1.0))
+CHANGE_FEED_KEEPALIVE_SECONDS = float(os.getenv("CHANGE_FEED_KEEPALIVE_SECONDS", 15.0))
+CHANGE_FEED_BATCH_SIZE = int(os.getenv("CHANGE_FEED_BATCH_SIZE", 500))
+CHANGE_FEED_MAX_STREAM_SECONDS = float(os.getenv("CHANGE_FEED_MAX_STREAM_SECONDS", 5 * 60))
+
+# Micro-batched product creates
+PRODUCT_WRITE_BATCHING = os.getenv("PRODUCT_WRITE_BATCHING", "false").lower() in ("1", "true", "yes")
+PRODUCT_WRITE_BATCH_SIZE = int(os.getenv("PRODUCT_WRITE_BATCH_SIZE", 200))
+PRODUCT_WRITE_BATCH_WINDOW_SECONDS = float(os.getenv("PRODUCT_WRITE_BATCH_WINDOW_SECONDS", 0.005))
+
+# Background catalog imports
+IMPORT_SPOOL_DIR = Path(os.getenv("IMPORT_SPOOL_DIR", Path(tempfile.gettempdir()) / "product_imports"))
+IMPORT_CHUNK_SIZE = int(os.getenv("IMPORT_CHUNK_SIZE", 5000))
+IMPORT_MAX_ERRORS = int(os.getenv("IMPORT_MAX_ERRORS", 1000))
+IMPORT_WORKER_POLL_INTERVAL_SECONDS = float(os.getenv("IMPORT_WORKER_POLL_INTERVAL_SECONDS", 1.0))
+IMPORT_MAX_RETRIES = int(os.getenv("IMPORT_MAX_RETRIES", 3))
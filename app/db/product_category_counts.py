@@ -0,0 +1,77 @@
+from sqlalchemy import BigInteger, Column, DDL, String, event
+
+from app.db.session import Base
+
+
+class ProductCategoryCount(Base):
+    """
+    ORM model holding the number of products per category.
+
+    Rows are maintained by statement-level triggers on the products table,
+    so every write path (ORM, bulk inserts, COPY, TRUNCATE) keeps the counts exact.
+
+    Attributes:
+        category: Product category (primary key)
+        product_count: Number of products in the category
+    """
+
+    __tablename__ = "product_category_counts"
+
+    category: str = Column(String(100), primary_key=True)
+    product_count: int = Column(BigInteger, nullable=False, default=0)
+
+    def __repr__(self) -> str:
+        """String representation of the ProductCategoryCount instance."""
+        return f"<ProductCategoryCount(category='{self.category}', product_count={self.product_count})>"
+
+
+COUNT_TRIGGERS_DDL = [
+    """
+    CREATE OR REPLACE FUNCTION product_category_counts_apply() RETURNS trigger AS $$
+    BEGIN
+        IF TG_OP = 'TRUNCATE' THEN
+            DELETE FROM product_category_counts;
+            RETURN NULL;
+        END IF;
+
+        IF TG_OP IN ('DELETE', 'UPDATE') THEN
+            UPDATE product_category_counts AS counts
+            SET product_count = counts.product_count - removed.product_count
+            FROM (SELECT category, count(*) AS product_count FROM old_rows GROUP BY category) AS removed
+            WHERE counts.category = removed.category;
+        END IF;
+
+        IF TG_OP IN ('INSERT', 'UPDATE') THEN
+            INSERT INTO product_category_counts (category, product_count)
+            SELECT category, count(*) FROM new_rows GROUP BY category ORDER BY category
+            ON CONFLICT (category) DO UPDATE
+            SET product_count = product_category_counts.product_count + EXCLUDED.product_count;
+        END IF;
+
+        RETURN NULL;
+    END;
+    $$ LANGUAGE plpgsql
+    """,
+    """
+    CREATE TRIGGER products_count_insert AFTER INSERT ON products
+    REFERENCING NEW TABLE AS new_rows
+    FOR EACH STATEMENT EXECUTE FUNCTION product_category_counts_apply()
+    """,
+    """
+    CREATE TRIGGER products_count_update AFTER UPDATE ON products
+    REFERENCING OLD TABLE AS old_rows NEW TABLE AS new_rows
+    FOR EACH STATEMENT EXECUTE FUNCTION product_category_counts_apply()
+    """,
+    """
+    CREATE TRIGGER products_count_delete AFTER DELETE ON products
+    REFERENCING OLD TABLE AS old_rows
+    FOR EACH STATEMENT EXECUTE FUNCTION product_category_counts_apply()
+    """,
+    """
+    CREATE TRIGGER products_count_truncate AFTER TRUNCATE ON products
+    FOR EACH STATEMENT EXECUTE FUNCTION product_category_counts_apply()
+    """,
+]
+
+for statement in COUNT_TRIGGERS_DDL:
+    event.listen(Base.metadata, "after_create", DDL(statement))
@@ -0,0 +1,31 @@
+from datetime import datetime
+
+from sqlalchemy import BigInteger, Column, DateTime, Integer, String, func
+
+from app.db.session import Base
+
+
+class ProductChange(Base):
+    """
+    ORM model representing a single entry of the product change log.
+
+    The change log is an append-only, compact record of product writes used
+    by the change feed. Entries are purged after a retention period.
+
+    Attributes:
+        seq: Monotonic sequence number of the change (primary key)
+        product_id: ID of the product that was changed
+        operation: Kind of change ("create", "update" or "delete")
+        created_at: Time when the change was recorded
+    """
+
+    __tablename__ = "product_changes"
+
+    seq: int = Column(BigInteger, primary_key=True, autoincrement=True)
+    product_id: int = Column(Integer, nullable=False)
+    operation: str = Column(String(10), nullable=False)
+    created_at: datetime = Column(DateTime(timezone=True), nullable=False, server_default=func.now(), index=True)
+
+    def __repr__(self) -> str:
+        """String representation of the ProductChange instance."""
+        return f"<ProductChange(seq={self.seq}, product_id={self.product_id}, operation='{self.operation}')>"
@@ -0,0 +1,52 @@
+from datetime import datetime
+from typing import List, Optional
+
+from sqlalchemy import BigInteger, Column, DateTime, Integer, String, Text, func
+from sqlalchemy.dialects.postgresql import JSONB
+
+from app.db.session import Base
+
+
+class ProductImportJob(Base):
+    """
+    ORM model representing a background import of a catalog file.
+
+    Attributes:
+        id: Unique identifier for the job (primary key)
+        status: Job status ("pending", "running", "completed" or "failed")
+        format: Format of the uploaded file ("csv" or "ndjson")
+        file_path: Path of the spooled upload on disk
+        bytes_total: Size of the uploaded file
+        bytes_processed: Number of bytes parsed so far
+        rows_processed: Number of rows parsed so far
+        rows_imported: Number of rows written to the catalog
+        rows_failed: Number of rejected rows
+        errors: Row-level errors (capped), e.g. [{"row": 3, "errors": ["..."]}]
+        error: Error that stopped the job, or the last transient error of a requeued job
+        retries: Number of times the job was requeued after a transient error
+        created_at: Time when the file was uploaded
+        started_at: Time when the worker picked the job up
+        finished_at: Time when the job completed or failed
+    """
+
+    __tablename__ = "product_import_jobs"
+
+    id: int = Column(Integer, primary_key=True, index=True)
+    status: str = Column(String(20), nullable=False, default="pending", index=True)
+    format: str = Column(String(10), nullable=False)
+    file_path: str = Column(String(1024), nullable=False)
+    bytes_total: int = Column(BigInteger, nullable=False, default=0)
+    bytes_processed: int = Column(BigInteger, nullable=False, default=0)
+    rows_processed: int = Column(Integer, nullable=False, default=0)
+    rows_imported: int = Column(Integer, nullable=False, default=0)
+    rows_failed: int = Column(Integer, nullable=False, default=0)
+    errors: List[dict] = Column(JSONB, nullable=False, default=list)
+    error: Optional[str] = Column(Text)
+    retries: int = Column(Integer, nullable=False, default=0)
+    created_at: datetime = Column(DateTime(timezone=True), nullable=False, server_default=func.now())
+    started_at: Optional[datetime] = Column(DateTime(timezone=True))
+    finished_at: Optional[datetime] = Column(DateTime(timezone=True))
+
+    def __repr__(self) -> str:
+        """String representation of the ProductImportJob instance."""
+        return f"<ProductImportJob(id={self.id}, status='{self.status}', rows_processed={self.rows_processed})>"
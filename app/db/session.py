@@ -20,6 +20,11 @@ AsyncSessionLocal = async_sessionmaker(
 Base = declarative_base()
 
 
+def get_session_factory() -> async_sessionmaker:
+    """Session factory for work that outlives the request, such as streaming responses."""
+    return AsyncSessionLocal
+
+
 async def get_db() -> AsyncSession:
     """
     Async session generator that handles automatic:
@@ -1,4 +1,5 @@
-from contextlib import asynccontextmanager
+import asyncio
+from contextlib import asynccontextmanager, suppress
 
 import uvicorn
 from dotenv import load_dotenv
@@ -6,6 +7,9 @@ from fastapi import FastAPI
 
 from app.api.api import main_router
 from app.db.session import engine
+from app.services.product_batcher import product_write_batcher
+from app.services.product_change import run_change_log_retention
+from app.services.product_import import run_import_worker
 from scripts.fill_db import init_db_with_test_data
 
 load_dotenv()
@@ -16,9 +20,18 @@ PORT = 8000
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     await init_db_with_test_data()
+    background_tasks = [
+        asyncio.create_task(run_change_log_retention()),
+        asyncio.create_task(run_import_worker()),
+    ]
 
     yield
 
+    for task in background_tasks:
+        task.cancel()
+        with suppress(asyncio.CancelledError):
+            await task
+    await product_write_batcher.close()
     await engine.dispose()
 
 
@@ -1,6 +1,7 @@
 from pydantic import BaseModel, Field, field_validator
 from typing import List, Optional
 from decimal import Decimal
+from enum import Enum
 
 
 class ProductBase(BaseModel):
@@ -101,3 +102,9 @@ class ProductListResponse(BaseModel):
             },
         }
         json_encoders = {Decimal: decimal_to_float}
+
+
+class CountPrecision(str, Enum):
+    """Precision of the total count returned with product listings."""
+    EXACT = "exact"
+    ESTIMATED = "estimated"
@@ -0,0 +1,57 @@
+from datetime import datetime
+from enum import Enum
+from typing import List
+
+from pydantic import BaseModel, Field
+
+
+class ChangeOperation(str, Enum):
+    """Kinds of product writes recorded in the change log."""
+    CREATE = "create"
+    UPDATE = "update"
+    DELETE = "delete"
+
+
+class ProductChangeResponse(BaseModel):
+    """Schema for a single change feed event."""
+    seq: int = Field(..., description="Monotonic sequence number of the change")
+    product_id: int = Field(..., description="ID of the changed product")
+    operation: ChangeOperation = Field(..., description="Kind of change")
+    created_at: datetime = Field(..., description="Time when the change was recorded")
+
+    class Config:
+        from_attributes = True
+        json_schema_extra = {
+            "example": {
+                "seq": 42,
+                "product_id": 10,
+                "operation": "create",
+                "created_at": "2025-01-01T12:00:00+00:00"
+            }
+        }
+
+
+class ProductChangesResponse(BaseModel):
+    """Schema for a batch of change feed events (long-poll mode)."""
+    changes: List[ProductChangeResponse] = Field(..., description="Changes after the requested sequence number")
+    last_event_id: int = Field(..., description="Sequence number to resume from on the next request")
+    reset: bool = Field(
+        False,
+        description="True if the requested position is no longer in the change log and the client must refetch the catalog",
+    )
+
+    class Config:
+        json_schema_extra = {
+            "example": {
+                "changes": [
+                    {
+                        "seq": 42,
+                        "product_id": 10,
+                        "operation": "create",
+                        "created_at": "2025-01-01T12:00:00+00:00"
+                    }
+                ],
+                "last_event_id": 42,
+                "reset": False
+            }
+        }
@@ -0,0 +1,85 @@
+from datetime import datetime, timezone
+from enum import Enum
+from typing import List, Optional
+
+from pydantic import BaseModel, Field, computed_field
+
+
+class ImportFormat(str, Enum):
+    """Supported formats of catalog files."""
+    CSV = "csv"
+    NDJSON = "ndjson"
+
+
+class ImportStatus(str, Enum):
+    """Statuses of a catalog import job."""
+    PENDING = "pending"
+    RUNNING = "running"
+    COMPLETED = "completed"
+    FAILED = "failed"
+
+
+class ImportRowError(BaseModel):
+    """Schema for a rejected row of a catalog file."""
+    row: int = Field(..., description="CSV record number (1-based, header excluded) or NDJSON line number")
+    errors: List[str] = Field(..., description="Validation or database errors of the row")
+
+
+class ProductImportJobResponse(BaseModel):
+    """Schema for catalog import job status and progress."""
+    id: int
+    status: ImportStatus
+    format: ImportFormat
+    bytes_total: int = Field(..., description="Size of the uploaded file")
+    bytes_processed: int = Field(..., description="Number of bytes parsed so far")
+    rows_processed: int = Field(..., description="Number of rows parsed so far")
+    rows_imported: int = Field(..., description="Number of rows written to the catalog")
+    rows_failed: int = Field(..., description="Number of rejected rows")
+    errors: List[ImportRowError] = Field(..., description="Row-level errors (capped)")
+    error: Optional[str] = Field(
+        None, description="Error that stopped the job, or the last transient error of a requeued job"
+    )
+    retries: int = Field(..., description="Number of times the job was requeued after a transient error")
+    created_at: datetime
+    started_at: Optional[datetime] = None
+    finished_at: Optional[datetime] = None
+
+    @computed_field(description="Share of the file parsed so far, in percent")
+    @property
+    def progress(self) -> float:
+        if self.status == ImportStatus.COMPLETED:
+            return 100.0
+        if not self.bytes_total:
+            return 0.0
+        return round(100 * self.bytes_processed / self.bytes_total, 2)
+
+    @computed_field(description="Rows parsed per second since the job started")
+    @property
+    def rows_per_second(self) -> float:
+        if not self.started_at:
+            return 0.0
+        elapsed = ((self.finished_at or datetime.now(timezone.utc)) - self.started_at).total_seconds()
+        return round(self.rows_processed / elapsed, 2) if elapsed > 0 else 0.0
+
+    class Config:
+        from_attributes = True
+        json_schema_extra = {
+            "example": {
+                "id": 1,
+                "status": "running",
+                "format": "csv",
+                "bytes_total": 52428800,
+                "bytes_processed": 26214400,
+                "rows_processed": 250000,
+                "rows_imported": 249990,
+                "rows_failed": 10,
+                "errors": [{"row": 17, "errors": ["price: Input should be greater than 0"]}],
+                "error": None,
+                "retries": 0,
+                "created_at": "2025-01-01T12:00:00+00:00",
+                "started_at": "2025-01-01T12:00:01+00:00",
+                "finished_at": None,
+                "progress": 50.0,
+                "rows_per_second": 12500.0
+            }
+        }
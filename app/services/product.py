@@ -1,9 +1,14 @@
+import json
+
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select
+from sqlalchemy import func, select, text
 from typing import List, Optional
 
+from app.db.product_category_counts import ProductCategoryCount
 from app.db.products import Product
-from app.schemas.product import ProductCreate
+from app.schemas.product import CountPrecision, ProductCreate
+from app.schemas.product_change import ChangeOperation
+from app.services.product_change import ProductChangeService
 
 
 class ProductService:
@@ -11,6 +16,7 @@ class ProductService:
 
     def __init__(self, db: AsyncSession):
         self.db = db
+        self.changes = ProductChangeService(db)
 
     async def get_all_products(self) -> List[Product]:
         """
@@ -52,6 +58,69 @@ class ProductService:
         )
         return result.scalars().all()
 
+    async def count_products(self, category: Optional[str], precision: CountPrecision) -> int:
+        """
+        Count products without scanning the products table.
+
+        Exact counts are read from the per-category counters maintained by
+        triggers. Estimated counts come from table statistics for the whole
+        catalog and from the planner row estimate for a single category.
+
+        Args:
+            category: Category name to count, None for all products
+            precision: Requested count precision
+
+        Returns:
+            Number of products
+        """
+        if precision == CountPrecision.ESTIMATED:
+            estimate = await self._estimate_products_count(category)
+
+            if estimate is not None:
+                return estimate
+
+        query = select(func.coalesce(func.sum(ProductCategoryCount.product_count), 0))
+
+        if category is not None:
+            query = query.where(ProductCategoryCount.category == category)
+
+        result = await self.db.execute(query)
+        return int(result.scalar_one())
+
+    async def _estimate_products_count(self, category: Optional[str]) -> Optional[int]:
+        """
+        Estimate the number of products from planner statistics.
+
+        The planner never estimates fewer than one row, so an estimate of one
+        is not trusted for a category and the exact counter is used instead.
+
+        Returns:
+            Estimated number of products, None if the table was never analyzed
+            or the category estimate is not meaningful
+        """
+        result = await self.db.execute(
+            text("SELECT reltuples FROM pg_class WHERE oid = 'products'::regclass")
+        )
+        reltuples = result.scalar_one()
+
+        if reltuples < 0:
+            return None
+
+        if category is None:
+            return int(reltuples)
+
+        result = await self.db.execute(
+            text("EXPLAIN (FORMAT JSON) SELECT 1 FROM products WHERE category = :category"),
+            {"category": category},
+        )
+        plan = result.scalar_one()
+
+        if isinstance(plan, str):
+            plan = json.loads(plan)
+
+        estimate = int(plan[0]["Plan"]["Plan Rows"])
+        return estimate if estimate > 1 else None
+
     async def create_product(self, product_data: ProductCreate) -> Product:
         """
         Create a new product in the database.
@@ -71,6 +140,7 @@ class ProductService:
         )
         self.db.add(db_product)
         await self.db.flush()
+        await self.changes.record_change(db_product.id, ChangeOperation.CREATE)
 
         return db_product
 
@@ -88,6 +158,7 @@ class ProductService:
 
         if db_product:
             await self.db.delete(db_product)
+            await self.changes.record_change(product_id, ChangeOperation.DELETE)
             return True
 
         return False
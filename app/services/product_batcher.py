@@ -0,0 +1,141 @@
+import asyncio
+from typing import List, Optional, Set, Tuple
+
+from sqlalchemy import insert
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from app.core.config import PRODUCT_WRITE_BATCHING, PRODUCT_WRITE_BATCH_SIZE, PRODUCT_WRITE_BATCH_WINDOW_SECONDS
+from app.db.products import Product
+from app.db.session import AsyncSessionLocal
+from app.schemas.product import ProductCreate
+from app.schemas.product_change import ChangeOperation
+from app.services.product_change import ProductChangeService
+
+
+class ProductWriteBatcher:
+    """
+    Collects concurrent product creates and writes them in batches.
+
+    Creates are buffered until the flush window expires or the batch is full,
+    then inserted with one multi-row statement in one transaction. Every
+    caller still gets its own product or its own error.
+    """
+
+    def __init__(
+            self,
+            session_factory: async_sessionmaker = AsyncSessionLocal,
+            max_batch_size: int = PRODUCT_WRITE_BATCH_SIZE,
+            flush_window: float = PRODUCT_WRITE_BATCH_WINDOW_SECONDS,
+    ):
+        self.session_factory = session_factory
+        self.max_batch_size = max_batch_size
+        self.flush_window = flush_window
+        self._pending: List[Tuple[ProductCreate, asyncio.Future]] = []
+        self._timer: Optional[asyncio.TimerHandle] = None
+        self._tasks: Set[asyncio.Task] = set()
+
+    async def create_product(self, product_data: ProductCreate) -> Product:
+        """
+        Queue a product for the next batch and wait until it is written.
+
+        Args:
+            product_data: Validated product data
+
+        Returns:
+            Created Product object
+        """
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        self._pending.append((product_data, future))
+
+        if len(self._pending) >= self.max_batch_size:
+            self._flush()
+        elif self._timer is None:
+            self._timer = loop.call_later(self.flush_window, self._flush)
+
+        return await future
+
+    async def close(self) -> None:
+        """Write pending products and wait for in-flight batches."""
+        self._flush()
+
+        if self._tasks:
+            await asyncio.gather(*self._tasks, return_exceptions=True)
+
+    def _flush(self) -> None:
+        """Hand the pending products over to a background write."""
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+
+        batch, self._pending = self._pending, []
+
+        if not batch:
+            return
+
+        task = asyncio.get_running_loop().create_task(self._write_batch(batch))
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    async def _write_batch(self, batch: List[Tuple[ProductCreate, asyncio.Future]]) -> None:
+        """Write a batch in one statement, falling back to per-product writes on failure."""
+        try:
+            async with self.session_factory() as session:
+                async with session.begin():
+                    products = await self._insert(session, [product_data for product_data, _ in batch])
+        except Exception:
+            await self._write_one_by_one(batch)
+            return
+
+        for (_, future), product in zip(batch, products):
+            if not future.done():
+                future.set_result(product)
+
+    async def _write_one_by_one(self, batch: List[Tuple[ProductCreate, asyncio.Future]]) -> None:
+        """Write a failed batch with a savepoint per product to isolate the failing ones."""
+        written = []
+
+        try:
+            async with self.session_factory() as session:
+                async with session.begin():
+                    for product_data, future in batch:
+                        try:
+                            async with session.begin_nested():
+                                [product] = await self._insert(session, [product_data])
+                        except Exception as exc:
+                            if not future.done():
+                                future.set_exception(exc)
+                            continue
+
+                        written.append((future, product))
+        except Exception as exc:
+            for _, future in batch:
+                if not future.done():
+                    future.set_exception(exc)
+            return
+
+        for future, product in written:
+            if not future.done():
+                future.set_result(product)
+
+    @staticmethod
+    async def _insert(session: AsyncSession, products_data: List[ProductCreate]) -> List[Product]:
+        """Insert products with one multi-row statement and record their changes."""
+        result = await session.scalars(
+            insert(Product).returning(Product, sort_by_parameter_order=True),
+            [product_data.model_dump() for product_data in products_data],
+        )
+        products = result.all()
+        await ProductChangeService(session).record_changes(
+            [product.id for product in products], ChangeOperation.CREATE
+        )
+
+        return products
+
+
+product_write_batcher = ProductWriteBatcher()
+
+
+def get_product_write_batcher() -> Optional[ProductWriteBatcher]:
+    """Write batcher for product creates, None when batching is disabled."""
+    return product_write_batcher if PRODUCT_WRITE_BATCHING else None
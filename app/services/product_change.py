@@ -0,0 +1,163 @@
+import asyncio
+from datetime import datetime, timedelta, timezone
+from typing import List, Optional, Tuple
+
+from sqlalchemy import delete, event, func, insert, select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session, SessionTransaction
+
+from app.core.config import CHANGE_LOG_PURGE_INTERVAL_SECONDS, CHANGE_LOG_RETENTION_SECONDS
+from app.db.product_changes import ProductChange
+from app.db.session import AsyncSessionLocal
+from app.schemas.product_change import ChangeOperation
+
+# Key of the transaction-level advisory lock that serializes change log writers
+CHANGE_LOG_LOCK_ID = 7_202_601
+
+# Session.info key of changes waiting for the transaction to commit
+PENDING_CHANGES_KEY = "pending_product_changes"
+
+
+class ProductChangeService:
+    """Service class for product change log operations."""
+
+    def __init__(self, db: AsyncSession):
+        self.db = db
+
+    async def record_change(self, product_id: int, operation: ChangeOperation) -> None:
+        """
+        Append a change to the product change log.
+
+        Args:
+            product_id: ID of the changed product
+            operation: Kind of change
+        """
+        await self.record_changes([product_id], operation)
+
+    async def record_changes(self, product_ids: List[int], operation: ChangeOperation) -> None:
+        """
+        Append changes of the same kind to the product change log.
+
+        Changes are queued on the session and written in one statement right
+        before the transaction commits (see write_pending_changes), so the
+        change log lock is only held for the commit itself.
+
+        Args:
+            product_ids: IDs of the changed products
+            operation: Kind of change
+        """
+        session = self.db.sync_session
+        transaction = session.get_nested_transaction() or session.get_transaction()
+        pending = session.info.setdefault(PENDING_CHANGES_KEY, [])
+        pending.extend(
+            (transaction, {"product_id": product_id, "operation": operation.value})
+            for product_id in product_ids
+        )
+
+    async def get_log_bounds(self) -> Tuple[Optional[int], Optional[int]]:
+        """
+        Retrieve the oldest and newest sequence numbers in the change log.
+
+        Returns:
+            Tuple of (oldest, newest) sequence numbers, (None, None) if the log is empty
+        """
+        result = await self.db.execute(
+            select(func.min(ProductChange.seq), func.max(ProductChange.seq))
+        )
+        oldest, newest = result.one()
+        return oldest, newest
+
+    async def get_changes_since(self, after: int, limit: int) -> List[ProductChange]:
+        """
+        Retrieve changes recorded after the given sequence number.
+
+        Args:
+            after: Sequence number of the last change seen by the client
+            limit: Maximum number of changes to return
+
+        Returns:
+            List of ProductChange objects ordered by sequence number
+        """
+        result = await self.db.execute(
+            select(ProductChange)
+            .where(ProductChange.seq > after)
+            .order_by(ProductChange.seq)
+            .limit(limit)
+        )
+        return result.scalars().all()
+
+    async def purge_expired(self, retention_seconds: int) -> int:
+        """
+        Delete changes older than the retention period.
+
+        The newest change is always kept, so clients resuming from a purged
+        position can still be detected and told to refetch the catalog.
+
+        Args:
+            retention_seconds: How long changes are kept in the log
+
+        Returns:
+            Number of deleted changes
+        """
+        cutoff = datetime.now(timezone.utc) - timedelta(seconds=retention_seconds)
+        newest = select(func.max(ProductChange.seq)).scalar_subquery()
+        result = await self.db.execute(
+            delete(ProductChange).where(
+                ProductChange.created_at < cutoff,
+                ProductChange.seq < newest,
+            )
+        )
+        return result.rowcount
+
+
+def is_within(transaction: Optional[SessionTransaction], ancestor: SessionTransaction) -> bool:
+    """Check whether a session transaction is the ancestor or one of its savepoints."""
+    while transaction is not None:
+        if transaction is ancestor:
+            return True
+        transaction = transaction.parent
+    return False
+
+
+@event.listens_for(Session, "before_commit")
+def write_pending_changes(session: Session) -> None:
+    """
+    Write queued changes to the change log when the outermost transaction commits.
+
+    Pending ORM writes are flushed first, so every product row and counter
+    lock is taken before the change log lock. The lock makes sequence numbers
+    visible to readers in commit order, so a reader resuming after a given
+    sequence number never skips a change. It is held only from here to COMMIT.
+    """
+    if session.in_nested_transaction() or not session.info.get(PENDING_CHANGES_KEY):
+        return
+
+    session.flush()
+    pending = session.info.pop(PENDING_CHANGES_KEY)
+    session.execute(select(func.pg_advisory_xact_lock(CHANGE_LOG_LOCK_ID)))
+    session.execute(insert(ProductChange), [values for _, values in pending])
+
+
+@event.listens_for(Session, "after_soft_rollback")
+def discard_pending_changes(session: Session, previous_transaction: SessionTransaction) -> None:
+    """Drop queued changes made in a transaction or savepoint that was rolled back."""
+    pending = session.info.get(PENDING_CHANGES_KEY)
+
+    if pending:
+        session.info[PENDING_CHANGES_KEY] = [
+            (transaction, values) for transaction, values in pending
+            if not is_within(transaction, previous_transaction)
+        ]
+
+
+async def run_change_log_retention() -> None:
+    """Periodically purge expired entries from the product change log."""
+    while True:
+        try:
+            async with AsyncSessionLocal() as session:
+                async with session.begin():
+                    await ProductChangeService(session).purge_expired(CHANGE_LOG_RETENTION_SECONDS)
+        except Exception as exc:
+            print(f"\n❌ Exception has occurred while change log was purging: {exc}")
+
+        await asyncio.sleep(CHANGE_LOG_PURGE_INTERVAL_SECONDS)
@@ -0,0 +1,590 @@
+import asyncio
+import csv
+import json
+from contextlib import suppress
+from datetime import datetime, timezone
+from decimal import Decimal
+from pathlib import Path
+from typing import AsyncIterator, Iterator, List, Optional, Tuple
+from uuid import uuid4
+
+from asyncpg import PostgresError
+from pydantic import ValidationError
+from sqlalchemy import func, select, text, update
+from sqlalchemy.exc import DBAPIError
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from app.core.config import (
+    IMPORT_CHUNK_SIZE,
+    IMPORT_MAX_ERRORS,
+    IMPORT_MAX_RETRIES,
+    IMPORT_SPOOL_DIR,
+    IMPORT_WORKER_POLL_INTERVAL_SECONDS,
+)
+from app.db.product_imports import ProductImportJob
+from app.db.products import Product
+from app.db.session import AsyncSessionLocal
+from app.schemas.product import ProductCreate
+from app.schemas.product_change import ChangeOperation
+from app.schemas.product_import import ImportFormat, ImportStatus
+from app.services.product_change import ProductChangeService
+
+# First key of the session-level advisory locks held by workers while they process a job
+IMPORT_JOB_LOCK_NAMESPACE = 7_202_602
+
+# Jobs whose worker no longer holds the job lock (see ProductImportService.claim_next_job)
+JOB_LOCK_FREE = text(
+    "NOT EXISTS (SELECT 1 FROM pg_locks WHERE locktype = 'advisory' AND granted "
+    "AND database = (SELECT oid FROM pg_database WHERE datname = current_database()) "
+    "AND classid = :namespace AND objid = product_import_jobs.id AND objsubid = 2)"
+).bindparams(namespace=IMPORT_JOB_LOCK_NAMESPACE)
+
+# Columns of the products table filled from catalog files
+IMPORT_COLUMNS = ["name", "description", "price", "category", "sizes"]
+
+# Column limits the database enforces beyond ProductCreate validation
+MAX_PRICE = Decimal(10) ** (Product.price.type.precision - Product.price.type.scale) - Decimal("0.01")
+MAX_SIZE_LENGTH = Product.sizes.type.item_type.length
+
+# One parsed chunk: valid rows, row errors, number of parsed rows and bytes consumed so far
+ImportChunk = Tuple[List[Tuple[int, ProductCreate]], List[dict], int, int]
+
+
+class ImportFileError(Exception):
+    """The spooled file of an import job cannot be read."""
+
+
+class ProductImportService:
+    """Service class for catalog import job operations."""
+
+    def __init__(self, db: AsyncSession):
+        self.db = db
+
+    async def create_job(self, import_format: ImportFormat, file_path: Path, bytes_total: int) -> ProductImportJob:
+        """
+        Create a pending import job for a spooled file.
+
+        Args:
+            import_format: Format of the file
+            file_path: Path of the spooled file
+            bytes_total: Size of the file
+
+        Returns:
+            Created ProductImportJob object
+        """
+        job = ProductImportJob(
+            status=ImportStatus.PENDING.value,
+            format=import_format.value,
+            file_path=str(file_path),
+            bytes_total=bytes_total,
+            errors=[],
+        )
+        self.db.add(job)
+        await self.db.flush()
+        await self.db.refresh(job)
+
+        return job
+
+    async def get_job_by_id(self, job_id: int) -> Optional[ProductImportJob]:
+        """
+        Retrieve an import job by its ID.
+
+        Args:
+            job_id: ID of the job to retrieve
+
+        Returns:
+            ProductImportJob object if found, None otherwise
+        """
+        result = await self.db.execute(
+            select(ProductImportJob).where(ProductImportJob.id == job_id)
+        )
+        return result.scalar_one_or_none()
+
+    async def claim_next_job(self) -> Optional[ProductImportJob]:
+        """
+        Mark the oldest pending job as running.
+
+        Pending jobs are locked with SKIP LOCKED, so several workers never
+        claim the same job. The claimed job also gets a session-level advisory
+        lock, held by the connection of this session until release_job is
+        called, which tells live workers apart from stopped ones.
+
+        Returns:
+            Claimed ProductImportJob object, None if there are no pending jobs
+        """
+        result = await self.db.execute(
+            select(ProductImportJob)
+            .where(ProductImportJob.status == ImportStatus.PENDING.value)
+            .order_by(ProductImportJob.id)
+            .limit(1)
+            .with_for_update(skip_locked=True)
+        )
+        job = result.scalar_one_or_none()
+
+        if job is None:
+            return None
+
+        locked = await self.db.scalar(select(func.pg_try_advisory_lock(IMPORT_JOB_LOCK_NAMESPACE, job.id)))
+
+        if not locked:
+            return None
+
+        job.status = ImportStatus.RUNNING.value
+        job.started_at = datetime.now(timezone.utc)
+        await self.db.flush()
+
+        return job
+
+    async def release_job(self, job_id: int) -> None:
+        """
+        Release the advisory lock taken by claim_next_job.
+
+        Args:
+            job_id: ID of the claimed job
+        """
+        await self.db.execute(select(func.pg_advisory_unlock(IMPORT_JOB_LOCK_NAMESPACE, job_id)))
+
+    async def requeue_running_jobs(self) -> int:
+        """
+        Return jobs left running by a stopped worker to the queue.
+
+        Jobs whose advisory lock is still held are being processed by a live
+        worker and are left alone. Progress is committed with every chunk, so
+        requeued jobs resume after the last committed row.
+
+        Returns:
+            Number of requeued jobs
+        """
+        result = await self.db.execute(
+            update(ProductImportJob)
+            .where(ProductImportJob.status == ImportStatus.RUNNING.value, JOB_LOCK_FREE)
+            .values(status=ImportStatus.PENDING.value, started_at=None)
+        )
+        return result.rowcount
+
+
+async def spool_upload(chunks: AsyncIterator[bytes]) -> Tuple[Path, int]:
+    """
+    Write an uploaded file to the spool directory chunk by chunk.
+
+    Args:
+        chunks: Body of the upload
+
+    Returns:
+        Tuple of (path of the spooled file, its size in bytes)
+    """
+    IMPORT_SPOOL_DIR.mkdir(parents=True, exist_ok=True)
+    file_path = IMPORT_SPOOL_DIR / f"{uuid4().hex}.upload"
+    size = 0
+
+    try:
+        with open(file_path, "wb") as file:
+            async for chunk in chunks:
+                await asyncio.to_thread(file.write, chunk)
+                size += len(chunk)
+    except Exception:
+        file_path.unlink(missing_ok=True)
+        raise
+
+    return file_path, size
+
+
+def format_error(exc: Exception) -> str:
+    """Short description of a database error without the failed statement."""
+    return str(getattr(exc, "orig", exc))
+
+
+def check_column_limits(product: ProductCreate) -> List[str]:
+    """
+    Check a validated product against limits of the products table.
+
+    Rows breaking them would be rejected by the database, so they are
+    reported as row errors before the chunk is written.
+    """
+    errors = []
+
+    if product.price > MAX_PRICE:
+        errors.append(f"price: Input should be less than or equal to {MAX_PRICE}")
+
+    if product.sizes and any(len(size) > MAX_SIZE_LENGTH for size in product.sizes):
+        errors.append(f"sizes: Each size should have at most {MAX_SIZE_LENGTH} characters")
+
+    for field in ("name", "description", "category"):
+        if "\x00" in (getattr(product, field) or ""):
+            errors.append(f"{field}: Text must not contain NUL characters")
+
+    return errors
+
+
+def read_chunks(
+        file_path: Path,
+        import_format: ImportFormat,
+        chunk_size: int,
+        skip_rows: int = 0,
+) -> Iterator[ImportChunk]:
+    """
+    Stream-parse a catalog file and validate its rows in chunks.
+
+    CSV files must have a header with product field names, sizes are
+    separated by semicolons. NDJSON files hold one product object per line.
+
+    Args:
+        file_path: Path of the file
+        import_format: Format of the file
+        chunk_size: Number of rows per chunk
+        skip_rows: Number of leading rows already imported by a previous run
+
+    Yields:
+        Chunks of validated rows
+    """
+    consumed = 0
+
+    def decoded_lines(file) -> Iterator[str]:
+        nonlocal consumed
+        for line_number, line in enumerate(file):
+            consumed += len(line)
+            yield line.decode("utf-8" if line_number else "utf-8-sig", errors="replace")
+
+    with open(file_path, "rb") as file:
+        lines = decoded_lines(file)
+
+        rows = iter_csv_rows(lines) if import_format == ImportFormat.CSV else iter_ndjson_rows(lines)
+        valid, errors, parsed = [], [], 0
+
+        for row_index, (row_number, row) in enumerate(rows, start=1):
+            if row_index <= skip_rows:
+                continue
+
+            parsed += 1
+
+            try:
+                if isinstance(row, Exception):
+                    raise row
+                product = ProductCreate.model_validate(row)
+                limit_errors = check_column_limits(product)
+                if limit_errors:
+                    errors.append({"row": row_number, "errors": limit_errors})
+                else:
+                    valid.append((row_number, product))
+            except ValidationError as exc:
+                messages = [f"{'.'.join(map(str, error['loc']))}: {error['msg']}" for error in exc.errors()]
+                errors.append({"row": row_number, "errors": messages})
+            except ValueError as exc:
+                errors.append({"row": row_number, "errors": [str(exc)]})
+
+            if parsed == chunk_size:
+                yield valid, errors, parsed, consumed
+                valid, errors, parsed = [], [], 0
+
+        if parsed:
+            yield valid, errors, parsed, consumed
+
+
+def next_chunk(chunks: Iterator[ImportChunk]) -> Optional[ImportChunk]:
+    """Read the next chunk, None at the end of the file, raising ImportFileError if the file cannot be read."""
+    try:
+        return next(chunks, None)
+    except Exception as exc:
+        raise ImportFileError(f"Error reading import file: {exc}") from exc
+
+
+def iter_csv_rows(lines: Iterator[str]) -> Iterator[Tuple[int, object]]:
+    """
+    Parse CSV records into product fields, numbered from 1 after the header.
+
+    Malformed records (e.g. NUL bytes or oversized fields) are yielded as
+    errors, and parsing continues with the next line.
+    """
+    reader = csv.reader(lines)
+    header = next(reader, None)
+    record_number = 0
+
+    if header is None:
+        return
+
+    while True:
+        try:
+            record = next(reader)
+        except StopIteration:
+            return
+        except csv.Error as exc:
+            record_number += 1
+            yield record_number, ValueError(f"Invalid CSV: {exc}")
+            continue
+
+        if not record:
+            continue
+
+        record_number += 1
+        yield record_number, parse_csv_row(dict(zip(header, record)))
+
+
+def iter_ndjson_rows(lines: Iterator[str]) -> Iterator[Tuple[int, object]]:
+    """Parse NDJSON lines into product fields, numbered by physical line."""
+    for line_number, line in enumerate(lines, start=1):
+        if line.strip():
+            yield line_number, parse_ndjson_row(line)
+
+
+def parse_csv_row(row: dict) -> dict:
+    """Convert a CSV record to product fields."""
+    product = {key: value or None for key, value in row.items() if key is not None}
+
+    if product.get("sizes"):
+        product["sizes"] = [size.strip() for size in product["sizes"].split(";") if size.strip()]
+
+    return product
+
+
+def parse_ndjson_row(line: str):
+    """Convert an NDJSON line to product fields, or an error for malformed lines."""
+    try:
+        return json.loads(line)
+    except json.JSONDecodeError as exc:
+        return ValueError(f"Invalid JSON: {exc}")
+
+
+class ProductImporter:
+    """Processes import jobs: parses spooled files and writes products in batches."""
+
+    def __init__(
+            self,
+            session_factory: async_sessionmaker = AsyncSessionLocal,
+            chunk_size: int = IMPORT_CHUNK_SIZE,
+            max_errors: int = IMPORT_MAX_ERRORS,
+            max_retries: int = IMPORT_MAX_RETRIES,
+    ):
+        self.session_factory = session_factory
+        self.chunk_size = chunk_size
+        self.max_errors = max_errors
+        self.max_retries = max_retries
+
+    async def run_next_job(self) -> bool:
+        """
+        Claim the oldest pending job and process it.
+
+        The job is claimed on a dedicated connection that holds the job lock
+        until processing ends. If the lock cannot be released, the connection
+        is discarded, which releases the lock on the server.
+
+        Returns:
+            True if a job was completed or failed, False if there was no job or it was requeued
+        """
+        async with self.session_factory.kw["bind"].connect() as connection:
+            async with self.session_factory(bind=connection) as session:
+                async with session.begin():
+                    job = await ProductImportService(session).claim_next_job()
+
+                if job is None:
+                    return False
+
+                try:
+                    return await self.process(job)
+                finally:
+                    try:
+                        async with session.begin():
+                            await ProductImportService(session).release_job(job.id)
+                    except Exception:
+                        await connection.invalidate()
+
+    async def process(self, job: ProductImportJob) -> bool:
+        """
+        Import a claimed job chunk by chunk, committing progress after every chunk.
+
+        Memory use is bounded by the chunk size and the number of kept errors.
+        A job interrupted by cancellation or by a transient error (e.g. a lost
+        database connection) goes back to the queue with its spooled file and
+        resumes after the last committed row; after max_retries transient
+        errors it fails. A file that cannot be read fails the job at once.
+
+        Returns:
+            True if the job was completed or failed, False if it was requeued
+        """
+        file_path = Path(job.file_path)
+        chunks = read_chunks(file_path, ImportFormat(job.format), self.chunk_size, job.rows_processed)
+        progress = {
+            "bytes_processed": job.bytes_processed,
+            "rows_processed": job.rows_processed,
+            "rows_imported": job.rows_imported,
+            "rows_failed": job.rows_failed,
+            "errors": list(job.errors),
+        }
+
+        try:
+            while chunk := await asyncio.to_thread(next_chunk, chunks):
+                progress = await self._write_chunk(job.id, chunk, progress)
+        except asyncio.CancelledError:
+            with suppress(ValueError):
+                chunks.close()
+            await self._requeue(job.id)
+            raise
+        except ImportFileError as exc:
+            status, error = ImportStatus.FAILED, str(exc)
+        except Exception as exc:
+            status, error = ImportStatus.FAILED, format_error(exc)
+
+            if job.retries < self.max_retries:
+                chunks.close()
+                await self._requeue(job.id, error)
+                return False
+        else:
+            status, error = ImportStatus.COMPLETED, None
+
+        chunks.close()
+        file_path.unlink(missing_ok=True)
+        await self._finish(job.id, status, error)
+        return True
+
+    async def _write_chunk(self, job_id: int, chunk: ImportChunk, progress: dict) -> dict:
+        """
+        Write a chunk with COPY in one transaction.
+
+        If the database rejects the chunk, it is split in halves under
+        savepoints until the failing rows are isolated, so the transaction
+        stays short.
+
+        Returns:
+            Job progress including the chunk, stored in the same transaction as its rows
+        """
+        valid, errors, parsed, consumed = chunk
+        row_errors = list(errors)
+
+        async with self.session_factory() as session:
+            async with session.begin():
+                await session.execute(text(
+                    "CREATE TEMP TABLE product_import_rows ("
+                    "name varchar(255), description text, price numeric(10, 2), "
+                    "category varchar(100), sizes varchar(20)[]"
+                    ") ON COMMIT DROP"
+                ))
+
+                imported = await self._copy_rows(session, valid, row_errors)
+                updated = self._advance(progress, imported, row_errors, parsed, consumed)
+                await self._save_progress(session, job_id, updated)
+
+        return updated
+
+    async def _copy_rows(
+            self,
+            session: AsyncSession,
+            rows: List[Tuple[int, ProductCreate]],
+            errors: List[dict],
+    ) -> int:
+        """Copy rows under a savepoint, bisecting on database errors to report the failing rows."""
+        if not rows:
+            return 0
+
+        try:
+            async with session.begin_nested():
+                return await self._copy_products(session, [product_data for _, product_data in rows])
+        except (DBAPIError, PostgresError) as exc:
+            if len(rows) == 1:
+                errors.append({"row": rows[0][0], "errors": [format_error(exc)]})
+                return 0
+
+        middle = len(rows) // 2
+        imported = await self._copy_rows(session, rows[:middle], errors)
+        return imported + await self._copy_rows(session, rows[middle:], errors)
+
+    @staticmethod
+    async def _copy_products(session: AsyncSession, products_data: List[ProductCreate]) -> int:
+        """
+        Write products with COPY through the temporary staging table.
+
+        COPY does not return generated ids, so rows are moved to the products
+        table with INSERT ... SELECT ... RETURNING to record their changes.
+        """
+        connection = await session.connection()
+        raw_connection = await connection.get_raw_connection()
+        await raw_connection.driver_connection.copy_records_to_table(
+            "product_import_rows",
+            records=[
+                (product.name, product.description, product.price, product.category, product.sizes)
+                for product in products_data
+            ],
+            columns=IMPORT_COLUMNS,
+        )
+
+        columns = ", ".join(IMPORT_COLUMNS)
+        result = await session.execute(text(
+            f"INSERT INTO products ({columns}) SELECT {columns} FROM product_import_rows RETURNING id"
+        ))
+        product_ids = result.scalars().all()
+        await session.execute(text("TRUNCATE product_import_rows"))
+        await ProductChangeService(session).record_changes(product_ids, ChangeOperation.CREATE)
+
+        return len(product_ids)
+
+    def _advance(self, progress: dict, imported: int, errors: List[dict], parsed: int, consumed: int) -> dict:
+        """Add chunk results to the job progress, keeping at most max_errors row errors."""
+        kept_errors = progress["errors"] + errors[:max(self.max_errors - len(progress["errors"]), 0)]
+        kept_errors.sort(key=lambda error: error["row"])
+
+        return {
+            "bytes_processed": consumed,
+            "rows_processed": progress["rows_processed"] + parsed,
+            "rows_imported": progress["rows_imported"] + imported,
+            "rows_failed": progress["rows_failed"] + len(errors),
+            "errors": kept_errors,
+        }
+
+    @staticmethod
+    async def _save_progress(session: AsyncSession, job_id: int, progress: dict) -> None:
+        """Store the job progress."""
+        await session.execute(
+            update(ProductImportJob).where(ProductImportJob.id == job_id).values(**progress)
+        )
+
+    async def _requeue(self, job_id: int, error: Optional[str] = None) -> None:
+        """Return an interrupted job to the queue, counting a retry if it stopped on an error."""
+        values = {"status": ImportStatus.PENDING.value, "started_at": None}
+
+        if error is not None:
+            values.update(error=error, retries=ProductImportJob.retries + 1)
+
+        async with self.session_factory() as session:
+            async with session.begin():
+                await session.execute(
+                    update(ProductImportJob).where(ProductImportJob.id == job_id).values(**values)
+                )
+
+    async def requeue_running_jobs(self) -> int:
+        """Return jobs left running by stopped workers to the queue."""
+        async with self.session_factory() as session:
+            async with session.begin():
+                return await ProductImportService(session).requeue_running_jobs()
+
+    async def _finish(self, job_id: int, status: ImportStatus, error: Optional[str] = None) -> None:
+        """Mark the job as completed or failed."""
+        async with self.session_factory() as session:
+            async with session.begin():
+                await session.execute(
+                    update(ProductImportJob)
+                    .where(ProductImportJob.id == job_id)
+                    .values(status=status.value, error=error, finished_at=datetime.now(timezone.utc))
+                )
+
+
+async def run_import_worker() -> None:
+    """
+    Pick up pending import jobs and process them one at a time.
+
+    Before every claim, jobs left running by stopped workers are requeued,
+    so jobs of a crashed process are picked up while this one is running.
+    """
+    importer = ProductImporter()
+
+    while True:
+        try:
+            await importer.requeue_running_jobs()
+        except Exception as exc:
+            print(f"\n❌ Exception has occurred while import jobs were requeuing: {exc}")
+
+        try:
+            finished = await importer.run_next_job()
+        except Exception as exc:
+            print(f"\n❌ Exception has occurred while import job was processing: {exc}")
+            finished = False
+
+        if not finished:
+            await asyncio.sleep(IMPORT_WORKER_POLL_INTERVAL_SECONDS)
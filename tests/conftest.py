@@ -5,7 +5,7 @@ from typing import AsyncGenerator
 
 from app.core.config import DATABASE_URL
 from app.main import app
-from app.db.session import get_db, Base
+from app.db.session import get_db, get_session_factory, Base
 from app.db.products import Product
 
 TEST_DATABASE_URL = DATABASE_URL
@@ -34,14 +34,25 @@ async def test_db_session() -> AsyncGenerator[AsyncSession, None]:
 
 
 @pytest_asyncio.fixture(scope="function")
-async def client(test_db_session: AsyncSession):
+async def session_factory(test_db_session: AsyncSession) -> async_sessionmaker:
+    """Session factory bound to the test database, for work outside the test session."""
+    return async_sessionmaker(test_db_session.bind, class_=AsyncSession, expire_on_commit=False)
+
+
+@pytest_asyncio.fixture(scope="function")
+async def client(test_db_session: AsyncSession, session_factory: async_sessionmaker):
     """Create test client with overridden database dependency."""
 
     async def override_get_db():
         yield test_db_session
+        await test_db_session.commit()
+
+    def override_get_session_factory():
+        return session_factory
 
     async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as test_client:
         app.dependency_overrides[get_db] = override_get_db
+        app.dependency_overrides[get_session_factory] = override_get_session_factory
         yield test_client
         app.dependency_overrides.clear()
 
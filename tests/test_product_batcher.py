@@ -0,0 +1,81 @@
+import asyncio
+
+import pytest
+from fastapi import status
+from sqlalchemy import func, select
+
+from app.db.product_changes import ProductChange
+from app.db.products import Product
+from app.main import app
+from app.schemas.product import ProductCreate
+from app.services.product_batcher import ProductWriteBatcher, get_product_write_batcher
+
+
+def make_product(index: int) -> ProductCreate:
+    return ProductCreate(name=f"Product {index}", price=10 + index, category="Batch", sizes=["M"])
+
+
+@pytest.mark.asyncio
+async def test_batcher_concurrent_creates(test_db_session, session_factory):
+    """Test that concurrent creates are written and each caller gets its own product."""
+    batcher = ProductWriteBatcher(session_factory=session_factory, max_batch_size=4, flush_window=0.01)
+
+    products = await asyncio.gather(*(batcher.create_product(make_product(i)) for i in range(10)))
+
+    assert [product.name for product in products] == [f"Product {i}" for i in range(10)]
+    assert len({product.id for product in products}) == 10
+
+    count = await test_db_session.scalar(select(func.count()).select_from(Product))
+    changes = await test_db_session.scalar(select(func.count()).select_from(ProductChange))
+
+    assert count == 10
+    assert changes == 10
+
+
+@pytest.mark.asyncio
+async def test_batcher_isolates_failing_product(test_db_session, session_factory):
+    """Test that a failing product does not fail the rest of its batch."""
+    batcher = ProductWriteBatcher(session_factory=session_factory, max_batch_size=3, flush_window=0.01)
+    invalid = ProductCreate.model_construct(name="x" * 300, price=1, category="Batch", description=None, sizes=None)
+
+    results = await asyncio.gather(
+        batcher.create_product(make_product(1)),
+        batcher.create_product(invalid),
+        batcher.create_product(make_product(2)),
+        return_exceptions=True,
+    )
+
+    assert isinstance(results[0], Product)
+    assert isinstance(results[1], Exception)
+    assert isinstance(results[2], Product)
+
+    count = await test_db_session.scalar(select(func.count()).select_from(Product))
+
+    assert count == 2
+
+
+
+@pytest.mark.asyncio
+async def test_create_product_endpoint_with_batching(client, test_db_session, session_factory):
+    """Test that batched creates through the endpoint answer each caller separately."""
+    batcher = ProductWriteBatcher(session_factory=session_factory, max_batch_size=3, flush_window=0.01)
+    app.dependency_overrides[get_product_write_batcher] = lambda: batcher
+    invalid = {**make_product(2).model_dump(mode="json"), "price": 100_000_000}
+
+    responses = await asyncio.gather(
+        client.post("/api/products/", json=make_product(1).model_dump(mode="json")),
+        client.post("/api/products/", json=invalid),
+        client.post("/api/products/", json=make_product(3).model_dump(mode="json")),
+    )
+
+    assert [response.status_code for response in responses] == [
+        status.HTTP_201_CREATED,
+        status.HTTP_500_INTERNAL_SERVER_ERROR,
+        status.HTTP_201_CREATED,
+    ]
+    assert "Error creating product" in responses[1].json()["detail"]
+    assert [responses[0].json()["name"], responses[2].json()["name"]] == ["Product 1", "Product 3"]
+
+    count = await test_db_session.scalar(select(func.count()).select_from(Product))
+
+    assert count == 2
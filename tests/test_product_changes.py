@@ -0,0 +1,220 @@
+import asyncio
+import json
+
+import pytest
+from fastapi import status
+
+from app.api.endpoints import product_changes
+from app.schemas.product import ProductCreate
+from app.services.product import ProductService
+
+PRODUCT_DATA = {
+    "name": "Test Product",
+    "description": "Test description",
+    "price": 10.5,
+    "category": "Test Category",
+    "sizes": ["M", "L"]
+}
+
+
+@pytest.mark.asyncio
+async def test_get_changes_subscribe_at_head(client, sample_products):
+    """Test that request without position returns the head of the change log."""
+    await client.post("/api/products/", json=PRODUCT_DATA)
+
+    response = await client.get("/api/products/changes")
+
+    assert response.status_code == status.HTTP_200_OK
+    data = response.json()
+
+    assert data["changes"] == []
+    assert data["last_event_id"] > 0
+    assert data["reset"] is False
+
+
+@pytest.mark.asyncio
+async def test_get_changes_after_create_and_delete(client):
+    """Test that create and delete are reported in order."""
+    created = (await client.post("/api/products/", json=PRODUCT_DATA)).json()
+    await client.delete(f"/api/products/{created['id']}")
+
+    response = await client.get("/api/products/changes?last_event_id=0")
+
+    assert response.status_code == status.HTTP_200_OK
+    data = response.json()
+
+    assert [change["operation"] for change in data["changes"]] == ["create", "delete"]
+    assert all(change["product_id"] == created["id"] for change in data["changes"])
+    assert data["changes"][0]["seq"] < data["changes"][1]["seq"]
+    assert data["last_event_id"] == data["changes"][-1]["seq"]
+
+
+@pytest.mark.asyncio
+async def test_get_changes_resume_from_last_event_id_header(client):
+    """Test resuming the feed with the Last-Event-ID header."""
+    await client.post("/api/products/", json=PRODUCT_DATA)
+    head = (await client.get("/api/products/changes")).json()["last_event_id"]
+    created = (await client.post("/api/products/", json=PRODUCT_DATA)).json()
+
+    response = await client.get("/api/products/changes", headers={"Last-Event-ID": str(head)})
+
+    assert response.status_code == status.HTTP_200_OK
+    data = response.json()
+
+    assert len(data["changes"]) == 1
+    assert data["changes"][0]["product_id"] == created["id"]
+
+
+@pytest.mark.asyncio
+async def test_get_changes_unknown_position_resets(client):
+    """Test that a position ahead of the change log asks the client to refetch."""
+    response = await client.get("/api/products/changes?last_event_id=1000")
+
+    assert response.status_code == status.HTTP_200_OK
+    data = response.json()
+
+    assert data["changes"] == []
+    assert data["reset"] is True
+
+
+@pytest.fixture
+def short_stream(monkeypatch):
+    """Make SSE streams end quickly so the whole response can be read."""
+    monkeypatch.setattr(product_changes, "CHANGE_FEED_MAX_STREAM_SECONDS", 0.3)
+    monkeypatch.setattr(product_changes, "CHANGE_FEED_POLL_INTERVAL_SECONDS", 0.05)
+
+
+def parse_events(body: str) -> list:
+    """Split an SSE body into events represented as dicts of fields."""
+    events = []
+    for block in body.strip().split("\n\n"):
+        event = {}
+        for line in block.split("\n"):
+            field, _, value = line.partition(":")
+            event[field] = value.strip()
+        events.append(event)
+    return events
+
+
+async def stream(client, **headers) -> list:
+    response = await client.get("/api/products/changes", headers={"Accept": "text/event-stream", **headers})
+
+    assert response.status_code == status.HTTP_200_OK
+    assert response.headers["content-type"].startswith("text/event-stream")
+
+    return parse_events(response.text)
+
+
+@pytest.mark.asyncio
+async def test_stream_changes_subscribe_sends_head_id(client, test_db_session, short_stream):
+    """Test that a new SSE subscriber gets the current head as its event ID."""
+    await client.post("/api/products/", json=PRODUCT_DATA)
+    await test_db_session.commit()
+    head = (await client.get("/api/products/changes")).json()["last_event_id"]
+
+    events = await stream(client)
+
+    assert "retry" in events[0]
+    assert events[1] == {"id": str(head)}
+    assert not any("event" in event for event in events)
+
+
+@pytest.mark.asyncio
+async def test_stream_changes_resume_from_last_event_id(client, test_db_session, short_stream):
+    """Test that SSE stream resumes after Last-Event-ID and frames events."""
+    await client.post("/api/products/", json=PRODUCT_DATA)
+    await test_db_session.commit()
+    head = (await client.get("/api/products/changes")).json()["last_event_id"]
+    created = (await client.post("/api/products/", json=PRODUCT_DATA)).json()
+    await client.delete(f"/api/products/{created['id']}")
+    await test_db_session.commit()
+
+    events = [event for event in await stream(client, **{"Last-Event-ID": str(head)}) if "event" in event]
+
+    assert [event["event"] for event in events] == ["create", "delete"]
+    assert [int(event["id"]) for event in events] == [head + 1, head + 2]
+    assert json.loads(events[0]["data"])["product_id"] == created["id"]
+
+
+@pytest.mark.asyncio
+async def test_stream_changes_unknown_position_resets(client, short_stream):
+    """Test that SSE stream sends a reset event for an unknown position."""
+    events = await stream(client, **{"Last-Event-ID": "1000"})
+
+    reset = next(event for event in events if event.get("event") == "reset")
+
+    assert reset["id"] == "0"
+    assert json.loads(reset["data"]) == {"last_event_id": 0}
+
+
+@pytest.mark.asyncio
+async def test_stream_changes_keepalive(client, monkeypatch, short_stream):
+    """Test that idle SSE stream sends keepalive comments."""
+    monkeypatch.setattr(product_changes, "CHANGE_FEED_KEEPALIVE_SECONDS", 0)
+
+    response = await client.get(
+        "/api/products/changes", headers={"Accept": "text/event-stream", "Last-Event-ID": "0"}
+    )
+
+    assert ": keepalive\n\n" in response.text
+
+
+@pytest.mark.asyncio
+async def test_get_changes_long_poll_waits_for_write(client, session_factory):
+    """Test that long-poll returns as soon as a change is committed."""
+    async def create_later():
+        await asyncio.sleep(0.3)
+        async with session_factory() as session:
+            async with session.begin():
+                return await ProductService(session).create_product(ProductCreate(**PRODUCT_DATA))
+
+    writer = asyncio.create_task(create_later())
+    started = asyncio.get_running_loop().time()
+
+    response = await client.get("/api/products/changes?last_event_id=0&wait=10")
+
+    elapsed = asyncio.get_running_loop().time() - started
+    created = await writer
+
+    assert response.status_code == status.HTTP_200_OK
+    data = response.json()
+
+    assert [change["product_id"] for change in data["changes"]] == [created.id]
+    assert 0.3 <= elapsed < 10
+
+
+@pytest.mark.asyncio
+async def test_open_write_transaction_does_not_block_other_writers(client, session_factory):
+    """Test that the change log lock is not held while a write transaction is open."""
+    async def create_single():
+        async with session_factory() as session:
+            async with session.begin():
+                return await ProductService(session).create_product(
+                    ProductCreate(**{**PRODUCT_DATA, "category": "Other Category"})
+                )
+
+    async with session_factory() as session:
+        async with session.begin():
+            first = await ProductService(session).create_product(ProductCreate(**PRODUCT_DATA))
+            second = await asyncio.wait_for(create_single(), timeout=5)
+
+    response = await client.get("/api/products/changes?last_event_id=0")
+
+    assert [change["product_id"] for change in response.json()["changes"]] == [second.id, first.id]
+
+
+@pytest.mark.asyncio
+async def test_rolled_back_savepoint_records_no_change(client, session_factory):
+    """Test that changes made in a rolled back savepoint are not written to the change log."""
+    async with session_factory() as session:
+        async with session.begin():
+            service = ProductService(session)
+            kept = await service.create_product(ProductCreate(**PRODUCT_DATA))
+
+            savepoint = await session.begin_nested()
+            await service.create_product(ProductCreate(**PRODUCT_DATA))
+            await savepoint.rollback()
+
+    response = await client.get("/api/products/changes?last_event_id=0")
+
+    assert [change["product_id"] for change in response.json()["changes"]] == [kept.id]
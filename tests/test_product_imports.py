@@ -0,0 +1,320 @@
+import asyncio
+import csv
+
+import pytest
+from fastapi import status
+from sqlalchemy import func, select
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from app.db.product_imports import ProductImportJob
+from app.db.products import Product
+from app.schemas.product import ProductCreate
+from app.schemas.product_import import ImportFormat
+from app.services.product_import import ProductImporter, ProductImportService
+
+CSV_CONTENT = (
+    "name,description,price,category,sizes\n"
+    "Cotton T-Shirt,Comfortable,25.99,T-Shirts,S;M;L\n"
+    "Broken Product,,-1,T-Shirts,\n"
+    "Slim Fit Jeans,,89.99,Pants,30;32\n"
+    "Winter Jacket,Warm,149.99,Outerwear,\n"
+)
+
+NDJSON_CONTENT = (
+    '{"name": "Summer Dress", "price": 59.99, "category": "Dresses", "sizes": ["S", "M"]}\n'
+    "not json\n"
+    '{"name": "Sports T-Shirt", "price": 35.99, "category": "T-Shirts"}\n'
+)
+
+
+async def run_import(
+        test_db_session: AsyncSession,
+        session_factory: async_sessionmaker,
+        tmp_path,
+        content: str,
+        import_format: ImportFormat,
+):
+    """Spool content, create a job and process it with a small chunk size."""
+    file_path = tmp_path / "catalog.upload"
+    file_path.write_text(content)
+
+    job = await ProductImportService(test_db_session).create_job(import_format, file_path, len(content))
+    job_id = job.id
+    await test_db_session.commit()
+
+    importer = ProductImporter(session_factory=session_factory, chunk_size=2)
+    await importer.run_next_job()
+
+    test_db_session.expire_all()
+    return await test_db_session.get(ProductImportJob, job_id)
+
+
+@pytest.mark.asyncio
+async def test_create_import_returns_job(client):
+    """Test that upload is accepted and a pending job is returned."""
+    response = await client.post(
+        "/api/products/imports", content=CSV_CONTENT, headers={"Content-Type": "text/csv"}
+    )
+
+    assert response.status_code == status.HTTP_202_ACCEPTED
+    data = response.json()
+
+    assert data["status"] == "pending"
+    assert data["format"] == "csv"
+    assert data["bytes_total"] == len(CSV_CONTENT)
+    assert data["progress"] == 0.0
+
+    response = await client.get(f"/api/products/imports/{data['id']}")
+
+    assert response.status_code == status.HTTP_200_OK
+    assert response.json()["id"] == data["id"]
+
+
+@pytest.mark.asyncio
+async def test_create_import_unsupported_format(client):
+    """Test that upload without a known format is rejected."""
+    response = await client.post(
+        "/api/products/imports", content="data", headers={"Content-Type": "application/octet-stream"}
+    )
+
+    assert response.status_code == status.HTTP_415_UNSUPPORTED_MEDIA_TYPE
+
+
+@pytest.mark.asyncio
+async def test_get_import_not_found(client):
+    """Test retrieving non-existent import job."""
+    response = await client.get("/api/products/imports/999")
+
+    assert response.status_code == status.HTTP_404_NOT_FOUND
+
+
+@pytest.mark.asyncio
+async def test_process_csv_import(test_db_session, session_factory, tmp_path):
+    """Test that valid CSV rows are imported and invalid rows are reported."""
+    job = await run_import(test_db_session, session_factory, tmp_path, CSV_CONTENT, ImportFormat.CSV)
+
+    assert job.status == "completed"
+    assert job.rows_processed == 4
+    assert job.rows_imported == 3
+    assert job.rows_failed == 1
+    assert job.bytes_processed == len(CSV_CONTENT)
+    assert [error["row"] for error in job.errors] == [2]
+
+    count = await test_db_session.scalar(select(func.count()).select_from(Product))
+    sizes = await test_db_session.scalar(select(Product.sizes).where(Product.name == "Cotton T-Shirt"))
+
+    assert count == 3
+    assert sizes == ["S", "M", "L"]
+
+
+@pytest.mark.asyncio
+async def test_process_ndjson_import(test_db_session, session_factory, tmp_path):
+    """Test that NDJSON import reports malformed lines."""
+    job = await run_import(test_db_session, session_factory, tmp_path, NDJSON_CONTENT, ImportFormat.NDJSON)
+
+    assert job.status == "completed"
+    assert job.rows_imported == 2
+    assert job.rows_failed == 1
+    assert job.errors[0]["row"] == 2
+
+
+class InterruptedImporter(ProductImporter):
+    """Importer cancelled right after its first chunk is committed."""
+
+    async def _write_chunk(self, job_id, chunk, progress):
+        progress = await super()._write_chunk(job_id, chunk, progress)
+        asyncio.current_task().cancel()
+        await asyncio.sleep(0)
+        return progress
+
+
+@pytest.mark.asyncio
+async def test_cancelled_import_is_requeued_and_resumed(test_db_session, session_factory, tmp_path):
+    """Test that a cancelled job goes back to the queue and resumes after committed rows."""
+    file_path = tmp_path / "catalog.upload"
+    file_path.write_text(CSV_CONTENT)
+
+    job = await ProductImportService(test_db_session).create_job(ImportFormat.CSV, file_path, len(CSV_CONTENT))
+    job_id = job.id
+    await test_db_session.commit()
+
+    interrupted = InterruptedImporter(session_factory=session_factory, chunk_size=2)
+
+    with pytest.raises(asyncio.CancelledError):
+        await asyncio.create_task(interrupted.run_next_job())
+
+    test_db_session.expire_all()
+    requeued = await test_db_session.get(ProductImportJob, job_id)
+
+    assert requeued.status == "pending"
+    assert requeued.rows_processed == 2
+    assert file_path.exists()
+
+    importer = ProductImporter(session_factory=session_factory, chunk_size=2)
+    await importer.run_next_job()
+
+    test_db_session.expire_all()
+    finished = await test_db_session.get(ProductImportJob, job_id)
+    count = await test_db_session.scalar(select(func.count()).select_from(Product))
+
+    assert finished.status == "completed"
+    assert finished.rows_processed == 4
+    assert finished.rows_imported == 3
+    assert count == 3
+    assert not file_path.exists()
+
+
+@pytest.mark.asyncio
+async def test_requeue_running_jobs(test_db_session, session_factory, tmp_path):
+    """Test that only jobs whose worker released the job lock are requeued."""
+    service = ProductImportService(test_db_session)
+    job = await service.create_job(ImportFormat.CSV, tmp_path / "catalog.upload", 0)
+    job_id = job.id
+    await service.claim_next_job()
+    await test_db_session.commit()
+
+    importer = ProductImporter(session_factory=session_factory)
+
+    assert await importer.requeue_running_jobs() == 0
+
+    await service.release_job(job_id)
+    await test_db_session.commit()
+
+    assert await importer.requeue_running_jobs() == 1
+
+    test_db_session.expire_all()
+
+    assert (await test_db_session.get(ProductImportJob, job_id)).status == "pending"
+
+
+class FailingImporter(ProductImporter):
+    """Importer whose chunk writes fail as if the database connection was lost."""
+
+    async def _write_chunk(self, job_id, chunk, progress):
+        raise ConnectionResetError("connection was closed in the middle of operation")
+
+
+@pytest.mark.asyncio
+async def test_transient_error_requeues_job_and_keeps_file(test_db_session, session_factory, tmp_path):
+    """Test that a transient error requeues the job until retries run out."""
+    file_path = tmp_path / "catalog.upload"
+    file_path.write_text(CSV_CONTENT)
+
+    job = await ProductImportService(test_db_session).create_job(ImportFormat.CSV, file_path, len(CSV_CONTENT))
+    job_id = job.id
+    await test_db_session.commit()
+
+    importer = FailingImporter(session_factory=session_factory, max_retries=1)
+
+    assert await importer.run_next_job() is False
+
+    test_db_session.expire_all()
+    requeued = await test_db_session.get(ProductImportJob, job_id)
+
+    assert requeued.status == "pending"
+    assert requeued.retries == 1
+    assert "connection was closed" in requeued.error
+    assert file_path.exists()
+
+    assert await importer.run_next_job() is True
+
+    test_db_session.expire_all()
+    failed = await test_db_session.get(ProductImportJob, job_id)
+
+    assert failed.status == "failed"
+    assert not file_path.exists()
+
+
+@pytest.mark.asyncio
+async def test_missing_file_fails_job(test_db_session, session_factory, tmp_path):
+    """Test that a job whose file cannot be read fails without retries."""
+    job = await ProductImportService(test_db_session).create_job(ImportFormat.CSV, tmp_path / "missing.upload", 0)
+    job_id = job.id
+    await test_db_session.commit()
+
+    assert await ProductImporter(session_factory=session_factory).run_next_job() is True
+
+    test_db_session.expire_all()
+    failed = await test_db_session.get(ProductImportJob, job_id)
+
+    assert failed.status == "failed"
+    assert failed.retries == 0
+    assert failed.error.startswith("Error reading import file")
+
+
+@pytest.mark.asyncio
+async def test_process_import_reports_column_limits(test_db_session, session_factory, tmp_path):
+    """Test that rows the database would reject are reported before writing."""
+    content = (
+        "name,description,price,category,sizes\n"
+        "Expensive Coat,,100000000.00,Outerwear,\n"
+        "Odd Sizes,,10.00,Outerwear,S;XXXXXXXXXXXXXXXXXXXXXXXXX\n"
+        "Plain Coat,,99.99,Outerwear,M\n"
+    )
+
+    job = await run_import(test_db_session, session_factory, tmp_path, content, ImportFormat.CSV)
+
+    assert job.status == "completed"
+    assert job.rows_imported == 1
+    assert [error["row"] for error in job.errors] == [1, 2]
+    assert job.errors[0]["errors"][0].startswith("price:")
+    assert job.errors[1]["errors"][0].startswith("sizes:")
+
+
+@pytest.mark.asyncio
+async def test_write_chunk_isolates_rows_rejected_by_database(test_db_session, session_factory, tmp_path):
+    """Test that a chunk rejected by the database is bisected down to the failing row."""
+    job = await ProductImportService(test_db_session).create_job(ImportFormat.CSV, tmp_path / "catalog.upload", 0)
+    await test_db_session.commit()
+
+    rows = [
+        (row, ProductCreate(name=f"Product {row}", price=10, category="Chunk"))
+        for row in range(1, 6)
+    ]
+    rows[2] = (3, ProductCreate(name="Broken\x00Product", price=10, category="Chunk"))
+
+    importer = ProductImporter(session_factory=session_factory)
+    progress = {"bytes_processed": 0, "rows_processed": 0, "rows_imported": 0, "rows_failed": 0, "errors": []}
+
+    progress = await importer._write_chunk(job.id, (rows, [], 5, 0), progress)
+
+    names = (await test_db_session.scalars(select(Product.name).order_by(Product.id))).all()
+
+    assert progress["rows_imported"] == 4
+    assert progress["rows_failed"] == 1
+    assert [error["row"] for error in progress["errors"]] == [3]
+    assert names == ["Product 1", "Product 2", "Product 4", "Product 5"]
+
+
+@pytest.mark.asyncio
+async def test_process_csv_import_malformed_record(test_db_session, session_factory, tmp_path):
+    """Test that a malformed CSV record is a row error and does not fail the job."""
+    content = (
+        "name,description,price,category,sizes\n"
+        "Cotton T-Shirt,,25.99,T-Shirts,\n"
+        f"Long Product,{'x' * 500},10.00,T-Shirts,\n"
+        "Winter Jacket,,149.99,Outerwear,\n"
+    )
+    field_size_limit = csv.field_size_limit(100)
+
+    try:
+        job = await run_import(test_db_session, session_factory, tmp_path, content, ImportFormat.CSV)
+    finally:
+        csv.field_size_limit(field_size_limit)
+
+    assert job.status == "completed"
+    assert job.rows_imported == 2
+    assert job.rows_failed == 1
+    assert job.errors[0]["row"] == 2
+    assert job.errors[0]["errors"][0].startswith("Invalid CSV")
+
+
+@pytest.mark.asyncio
+async def test_process_ndjson_import_numbers_rows_by_line(test_db_session, session_factory, tmp_path):
+    """Test that NDJSON row errors point at physical lines, counting blank lines."""
+    content = "\n" + NDJSON_CONTENT.replace("\nnot json", "\n\nnot json")
+
+    job = await run_import(test_db_session, session_factory, tmp_path, content, ImportFormat.NDJSON)
+
+    assert job.rows_imported == 2
+    assert job.errors[0]["row"] == 4
@@ -1,7 +1,13 @@
+import asyncio
+
 import pytest
 from fastapi import status
+from sqlalchemy import select, text
 
+from app.db.product_category_counts import ProductCategoryCount
 from app.db.products import Product
+from app.schemas.product import ProductCreate
+from app.services.product import ProductService
 
 
 @pytest.mark.asyncio
@@ -165,3 +171,115 @@ async def test_get_products_response_order(client, sample_products):
     data2 = response2.json()
 
     assert len(data1) == len(data2)
+
+
+@pytest.mark.asyncio
+async def test_get_products_without_total_count(client, sample_products):
+    """Test that total count is only returned on request."""
+    response = await client.get("/api/products/")
+
+    assert response.status_code == status.HTTP_200_OK
+    assert "X-Total-Count" not in response.headers
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("category, expected", [(None, 5), ("T-Shirts", 2), ("NonExistent", 0)])
+async def test_get_products_exact_total_count(client, sample_products, category, expected):
+    """Test exact total count maintained per category."""
+    params = {"count": "exact"}
+    if category:
+        params["category"] = category
+
+    response = await client.get("/api/products/", params=params)
+
+    assert response.status_code == status.HTTP_200_OK
+    assert response.headers["X-Total-Count"] == str(expected)
+    assert response.headers["X-Total-Count-Precision"] == "exact"
+
+
+@pytest.mark.asyncio
+async def test_get_products_total_count_after_delete(client, sample_products):
+    """Test that total count follows deletions."""
+    await client.delete(f"/api/products/{sample_products[0].id}")
+
+    response = await client.get("/api/products/?category=T-Shirts&count=exact")
+
+    assert response.headers["X-Total-Count"] == "1"
+
+
+@pytest.mark.asyncio
+async def test_get_products_estimated_total_count(client, sample_products):
+    """Test that estimated total count is returned as a non-negative number."""
+    response = await client.get("/api/products/?count=estimated")
+
+    assert response.status_code == status.HTTP_200_OK
+    assert int(response.headers["X-Total-Count"]) >= 0
+    assert response.headers["X-Total-Count-Precision"] == "estimated"
+
+
+@pytest.mark.asyncio
+async def test_get_products_estimated_total_count_after_analyze(client, test_db_session, sample_products):
+    """Test that estimated counts come from planner statistics once the table is analyzed."""
+    await test_db_session.execute(text("ANALYZE products"))
+    await test_db_session.commit()
+
+    response_all = await client.get("/api/products/?count=estimated")
+    response_category = await client.get("/api/products/?category=T-Shirts&count=estimated")
+
+    assert response_all.headers["X-Total-Count"] == "5"
+    assert response_category.headers["X-Total-Count"] == "2"
+    assert response_category.headers["X-Total-Count-Precision"] == "estimated"
+
+
+@pytest.mark.asyncio
+async def test_get_products_estimated_count_of_missing_category(client, test_db_session, sample_products):
+    """Test that the planner minimum of one row falls back to the exact category counter."""
+    await test_db_session.execute(text("ANALYZE products"))
+    await test_db_session.commit()
+
+    response = await client.get("/api/products/?category=Unknown&count=estimated")
+
+    assert response.status_code == status.HTTP_200_OK
+    assert response.headers["X-Total-Count"] == "0"
+
+
+@pytest.mark.asyncio
+async def test_get_products_total_count_after_truncate(client, test_db_session, sample_products):
+    """Test that truncating products resets the category counters."""
+    await test_db_session.execute(text("TRUNCATE products"))
+    await test_db_session.commit()
+
+    response = await client.get("/api/products/?count=exact")
+
+    assert response.headers["X-Total-Count"] == "0"
+
+
+@pytest.mark.asyncio
+async def test_concurrent_writes_do_not_deadlock(test_db_session, session_factory):
+    """Test that a multi-write transaction racing a single create keeps a consistent lock order."""
+    def make_product(category: str) -> ProductCreate:
+        return ProductCreate(name="Product", price=10, category=category)
+
+    async def create_single():
+        async with session_factory() as session:
+            async with session.begin():
+                await ProductService(session).create_product(make_product("Jeans"))
+
+    async with session_factory() as session:
+        async with session.begin():
+            service = ProductService(session)
+            await service.create_product(make_product("Shirts"))
+
+            single = asyncio.create_task(create_single())
+            await asyncio.sleep(0.3)
+
+            await service.create_product(make_product("Jeans"))
+
+    await asyncio.wait_for(single, timeout=10)
+
+    counts = await test_db_session.execute(
+        select(ProductCategoryCount.category, ProductCategoryCount.product_count)
+        .order_by(ProductCategoryCount.category)
+    )
+
+    assert counts.all() == [("Jeans", 2), ("Shirts", 1)]